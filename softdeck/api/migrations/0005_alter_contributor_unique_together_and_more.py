@@ -0,0 +1,33 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_issue_comment_project_issue_project_contributor'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='contributor',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='assigned_to',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='assigned_issues', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='status',
+            field=models.CharField(choices=[('TODO', 'To do'), ('IN_PROGRESS', 'In progress'), ('FINISHED', 'Finished')], default='TODO', max_length=15),
+        ),
+        migrations.AddConstraint(
+            model_name='contributor',
+            constraint=models.UniqueConstraint(fields=('project', 'user'), name='uniq_contributor_project_user'),
+        ),
+    ]
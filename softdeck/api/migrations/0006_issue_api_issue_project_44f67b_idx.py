@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_alter_contributor_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'status'], name='api_issue_project_44f67b_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_issue_api_issue_project_44f67b_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='title',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_alter_project_title'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='issue',
+            name='assigned_to',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assigned_issues', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:36
+
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_alter_issue_assigned_to'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='id',
+            field=models.UUIDField(default=api.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_alter_comment_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contributor',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='contributor',
+            index=models.Index(fields=['user', 'project'], name='api_contrib_user_id_920dc8_idx'),
+        ),
+    ]
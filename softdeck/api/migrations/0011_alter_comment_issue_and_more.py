@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_alter_contributor_user_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='issue',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='api.issue'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['issue', '-created_time'], name='api_comment_issue_i_f11987_idx'),
+        ),
+    ]
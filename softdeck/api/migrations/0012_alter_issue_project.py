@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-15 21:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_alter_comment_issue_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='issue',
+            name='project',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='issues', to='api.project'),
+        ),
+    ]
@@ -0,0 +1,145 @@
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.utils import model_meta
+
+
+def get_related_lookups(serializer_class, prefix=''):
+    """
+    Walks the readable fields of a model serializer and lists the relations it renders.
+
+    Forward foreign keys and one-to-one fields that are rendered through a nested serializer
+    or a related field reading more than the primary key are joined with `select_related`.
+    Many-to-many and reverse relations are collected for `prefetch_related`. A
+    `PrimaryKeyRelatedField` on a forward relation is skipped, DRF reads it from the local
+    `<field>_id` column without loading the related row.
+
+    :param serializer_class: The model serializer class to inspect.
+    :param prefix: Lookup prefix used when walking a nested serializer.
+    :return: The `select_related` and `prefetch_related` lookups.
+    :rtype: tuple[list[str], list[str]]
+    """
+    select, prefetch = [], []
+    serializer = serializer_class()
+    relations = model_meta.get_field_info(serializer.Meta.model).relations
+
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*' or '.' in field.source:
+            continue
+        relation = relations.get(field.source)
+        if relation is None:
+            continue
+
+        lookup = prefix + field.source
+        if isinstance(field, serializers.ListSerializer):
+            field = field.child
+        if relation.to_many or not relation.model_field:
+            prefetch.append(lookup)
+            if isinstance(field, serializers.ModelSerializer):
+                # Nested relations of a prefetched serializer are all prefetched from its queryset
+                nested_select, nested_prefetch = get_related_lookups(type(field), lookup + '__')
+                prefetch.extend(nested_select + nested_prefetch)
+        elif not isinstance(field, PrimaryKeyRelatedField):
+            select.append(lookup)
+            if isinstance(field, serializers.ModelSerializer):
+                nested_select, nested_prefetch = get_related_lookups(type(field), lookup + '__')
+                select.extend(nested_select)
+                prefetch.extend(nested_prefetch)
+
+    return select, prefetch
+
+
+class AutoPrefetchMixin:
+    """
+    Loads the relations rendered by the view's serializer alongside the queryset.
+
+    The lookups are computed from `get_serializer_class()` once per serializer class, then
+    applied in `filter_queryset`, which both `list` and `get_object` go through, so the
+    views keep their own `get_queryset`.
+    """
+    _related_lookups_cache = {}
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer_class = self.get_serializer_class()
+        lookups = self._related_lookups_cache.get(serializer_class)
+        if lookups is None:
+            lookups = self._related_lookups_cache[serializer_class] = get_related_lookups(serializer_class)
+        select, prefetch = lookups
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+class ListOnlyFieldsMixin:
+    """
+    Restricts the columns selected by the list action to `only_fields`.
+
+    List serializers only render a few columns; narrowing the SELECT keeps the rows read
+    from the database, and the model instances built from them, small. Views that are not
+    routed through a viewset have no `action` and are treated as list views.
+
+    :ivar only_fields: Model fields loaded by the list action, every column when empty.
+    :type only_fields: tuple
+    """
+    only_fields = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.only_fields and getattr(self, 'action', 'list') == 'list':
+            queryset = queryset.only(*self.only_fields)
+        return queryset
+
+
+class ListValuesMixin:
+    """
+    Serves the list action from `QuerySet.values()` rows instead of model instances.
+
+    The list serializers only read plain columns, which DRF reads from a dict as well as
+    from an instance, so building a model instance per row can be skipped. Other actions
+    keep working on model instances.
+
+    :ivar list_values_fields: Columns read by the list serializer, the regular model path
+        being used when empty.
+    :type list_values_fields: tuple
+    """
+    list_values_fields = ()
+
+    def list(self, request, *args, **kwargs):
+        if not self.list_values_fields:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset()).values(*self.list_values_fields)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+
+class ActionSerializerMixin:
+    """
+    Picks the serializer class of a view from a per-action mapping.
+
+    The default serializer is resolved once, when the view class is created, so a missing
+    `'default'` entry fails at import time rather than on the first unlisted action.
+
+    :ivar serializer_classes: Serializer class per action, the `'default'` entry being used
+        for every action that is not listed.
+    :type serializer_classes: dict
+    """
+    serializer_classes = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        assert 'default' in cls.serializer_classes, (
+            f"'{cls.__name__}' should include a 'default' entry in `serializer_classes`."
+        )
+        cls._default_serializer_class = cls.serializer_classes['default']
+
+    def get_serializer_class(self):
+        return self.serializer_classes.get(self.action, self._default_serializer_class)
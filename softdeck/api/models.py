@@ -4,9 +4,36 @@ from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from datetime import date
 from django.conf import settings
+import os
+import time
 import uuid
 
 
+MINIMUM_AGE = 15
+_cutoff_cache = {}
+
+
+def _min_age_cutoff():
+    """
+    Returns the latest birth date allowed today, i.e. today's date
+    `MINIMUM_AGE` years ago. The value is computed once per day.
+
+    :return: The cutoff date for today.
+    :rtype: datetime.date
+    """
+    today = date.today()
+    cutoff = _cutoff_cache.get(today)
+    if cutoff is None:
+        try:
+            cutoff = today.replace(year=today.year - MINIMUM_AGE)
+        except ValueError:
+            # Today is February 29th and the cutoff year is not a leap year.
+            cutoff = today.replace(year=today.year - MINIMUM_AGE, day=28)
+        _cutoff_cache.clear()
+        _cutoff_cache[today] = cutoff
+    return cutoff
+
+
 def validate_age(birth_date):
     """
     Validates if the user's age is at least 15 years old based on their birth_date.
@@ -17,12 +44,29 @@ def validate_age(birth_date):
     :raises ValidationError: If the user's age is less than 15.
     :return: None
     """
-    today = date.today()
-    age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-    if age < 15:
+    if birth_date > _min_age_cutoff():
         raise ValidationError(_("L'utilisateur doit avoir au moins 15 ans."))
 
 
+def uuid7():
+    """
+    Generates a time-ordered UUID (version 7, RFC 9562).
+
+    The 48 most significant bits hold the Unix timestamp in milliseconds and
+    the remaining bits are random, so successive values sort by creation time
+    and new rows are appended at the end of the primary key index instead of
+    landing on random pages.
+
+    :return: A new version 7 UUID.
+    :rtype: uuid.UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # Version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class CustomUser(AbstractUser):
     """
     Represents a custom user extending the default Django AbstractUser.
@@ -44,29 +88,20 @@ class CustomUser(AbstractUser):
     can_be_contacted = models.BooleanField(default=False)
     can_data_be_shared = models.BooleanField(default=False)
 
-    def clean(self):
-        if self.birth_date:
-            validate_age(self.birth_date)  # Extra Validation
-
-    def save(self, *args, **kwargs):
-        self.clean()
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return self.username
 
 
 class Project(models.Model):
-    TYPE_CHOICES = [
-        ("BACKEND", "Back-end"),
-        ("FRONTEND", "Front-end"),
-        ("IOS", "iOS"),
-        ("ANDROID", "Android")
-    ]
+    class Type(models.TextChoices):
+        BACKEND = "BACKEND", "Back-end"
+        FRONTEND = "FRONTEND", "Front-end"
+        IOS = "IOS", "iOS"
+        ANDROID = "ANDROID", "Android"
 
-    title = models.CharField(max_length=255)
+    title = models.CharField(max_length=255, db_index=True)
     description = models.TextField(blank=True)
-    type = models.CharField(max_length=10, choices=TYPE_CHOICES)
+    type = models.CharField(max_length=10, choices=Type.choices)
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="owned_projects")
 
     def __str__(self):
@@ -74,54 +109,88 @@ class Project(models.Model):
 
 
 class Contributor(models.Model):
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    # Indexed by (user, project) below, which also serves lookups on the user alone
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="contributors")
 
     class Meta:
-        unique_together = ("user", "project")
+        constraints = [
+            models.UniqueConstraint(fields=["project", "user"], name="uniq_contributor_project_user")
+        ]
+        indexes = [
+            models.Index(fields=["user", "project"]),
+        ]
 
     def __str__(self):
         return f"{self.user.username} → ({self.project.title})"
 
 
 class Issue(models.Model):
-    PRIORITY_CHOICES = [
-        ("LOW", "Low"),
-        ("MEDIUM", "Medium"),
-        ("HIGH", "High")
-    ]
-    TAG_CHOICES = [
-        ("BUG", "Bug"),
-        ("FEATURE", "Feature"),
-        ("TASK", "Task")
-    ]
-    STATUS_CHOICES = [
-        ("TODO", "To do"),
-        ("IN_PROGRESS", "In progress"),
-        ("FINISHED", "Finished")
-    ]
+    class Priority(models.TextChoices):
+        LOW = "LOW", "Low"
+        MEDIUM = "MEDIUM", "Medium"
+        HIGH = "HIGH", "High"
+
+    class Tag(models.TextChoices):
+        BUG = "BUG", "Bug"
+        FEATURE = "FEATURE", "Feature"
+        TASK = "TASK", "Task"
+
+    class Status(models.TextChoices):
+        TODO = "TODO", "To do"
+        IN_PROGRESS = "IN_PROGRESS", "In progress"
+        FINISHED = "FINISHED", "Finished"
 
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
-    priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES)
-    tag = models.CharField(max_length=10, choices=TAG_CHOICES)
-    status = models.CharField(max_length=15, choices=STATUS_CHOICES, default="TODO")
-    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="issues")
-    assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, on_delete=models.CASCADE,
+    priority = models.CharField(max_length=10, choices=Priority.choices)
+    tag = models.CharField(max_length=10, choices=Tag.choices)
+    status = models.CharField(max_length=15, choices=Status.choices, default=Status.TODO)
+    # Indexed by (project, status) below, which also serves lookups on the project alone
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="issues", db_index=False)
+    assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, on_delete=models.SET_NULL,
                                     related_name="assigned_issues")
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="created_issues")
     created_time = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "status"]),
+        ]
+
+    @classmethod
+    def claim_next(cls, project_id):
+        """
+        Locks and returns the oldest "TODO" issue of a project, skipping rows
+        already locked by another transaction so that concurrent workers never
+        wait on each other. Must be called inside `transaction.atomic()`.
+
+        :param project_id: The id of the project to pick an issue from.
+        :return: The claimed issue, or None if no unlocked issue is left.
+        :rtype: Issue | None
+        """
+        return (
+            cls.objects.select_for_update(skip_locked=True)
+            .filter(project_id=project_id, status=cls.Status.TODO)
+            .first()
+        )
+
     def __str__(self):
         return f"{self.title}, créé le ({self.created_time})"
 
 
 class Comment(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     description = models.TextField(blank=True)
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="created_comments")
-    issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name="comments")
+    # Indexed by (issue, -created_time) below, which also serves lookups on the issue alone
+    issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name="comments", db_index=False)
     created_time = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["issue", "-created_time"]),
+        ]
+
     def __str__(self):
         return f"Commentaire de {self.author.username} sur l'issue {self.issue.title}"
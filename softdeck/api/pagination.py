@@ -0,0 +1,21 @@
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Paginates lists with an opaque cursor on the primary key, newest rows first.
+
+    Each page is read with `WHERE id < <last id> ORDER BY id DESC LIMIT n` on the primary
+    key index, so its cost does not grow with the position in the list as an OFFSET does.
+    """
+    ordering = '-id'
+
+
+class CreatedTimeCursorPagination(CursorPagination):
+    """
+    Paginates lists with an opaque cursor on the creation date, newest rows first.
+
+    Used where the primary key does not follow insertion order, such as comments, whose
+    older rows carry random uuid4 ids.
+    """
+    ordering = '-created_time'
@@ -1,5 +1,63 @@
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import BasePermission, SAFE_METHODS
-from .models import Project
+from .models import Contributor, Project
+
+PROJECT_AUTHOR_CACHE_TIMEOUT = 60
+# Hashed membership test instead of a scan of the SAFE_METHODS tuple
+_SAFE_METHODS = frozenset(SAFE_METHODS)
+
+
+def project_author_cache_key(pk):
+    return f"proj_author:{pk}"
+
+
+def get_project_author_id(request, pk):
+    """
+    Returns the author id of the project identified by `pk`, or None if the
+    project does not exist.
+
+    The value is read from the shared cache (falling back to a single-column
+    query) and then memoized on the request, so that every permission class
+    and every hook DRF calls during a single request share one lookup. Cache
+    entries are invalidated by the `Project` signal handlers in `signals.py`.
+    """
+    memo = getattr(request, "_sd_perm", None)
+    if memo is None:
+        memo = request._sd_perm = {}
+    if pk not in memo:
+        key = project_author_cache_key(pk)
+        author_id = cache.get(key)
+        if author_id is None:
+            author_id = Project.objects.filter(pk=pk).values_list("author_id", flat=True).first()
+            # Missing projects are cached as 0 so that they are not looked up again.
+            cache.set(key, author_id or 0, PROJECT_AUTHOR_CACHE_TIMEOUT)
+        memo[pk] = author_id or None
+    return memo[pk]
+
+
+def _get_project_access(request, pk):
+    """
+    Returns the author id of the project identified by `pk` along with whether the
+    requesting user is one of its contributors, or None if the project does not exist.
+
+    Both values come from a single query and are memoized on the request, so that
+    `has_permission` and `has_object_permission` share one lookup.
+    """
+    memo = getattr(request, "_project_perm", None)
+    if memo is None:
+        memo = request._project_perm = {}
+    key = str(pk)
+    if key not in memo:
+        is_contributor = Exists(Contributor.objects.filter(project=OuterRef("pk"), user_id=request.user.id))
+        memo[key] = (
+            Project.objects.filter(pk=pk)
+            .annotate(is_contributor=is_contributor)
+            .values("author_id", "is_contributor")
+            .first()
+        )
+    return memo[key]
 
 
 class IsAuthorOrReadOnly(BasePermission):
@@ -12,27 +70,50 @@ class IsAuthorOrReadOnly(BasePermission):
     or delete it.
     """
     def has_object_permission(self, request, view, obj):
-        if request.method in SAFE_METHODS:
+        if request.method in _SAFE_METHODS:
             return True
-        return obj.author == request.user
+        return obj.author_id == request.user.id
 
 
-class IsContributor(BasePermission):
+class IsProjectContributor(BasePermission):
     """
-    Custom permission class to check if a user is a contributor to a given project.
+    Custom permission class granting access to a project to its contributors, while
+    restricting modifications to the project's author.
 
-    The purpose of this class is to ensure access control by allowing actions only to users
-    who are contributors of a specified project. The permission is determined based on the
-    `project_pk` obtained from the view's keyword arguments and checks the existence of
-    an association between the user and the project in the Contributor model.
+    It combines the checks formerly split between `IsContributor` and `IsAuthorOrReadOnly`
+    so that DRF evaluates a single permission per request. Authorship and membership are
+    resolved together by one query on the project identified by the view's `pk`.
+    Requests without a `pk` (list, create) are left to the view's queryset.
+
+    Projects the user takes no part in are reported as not found, like unknown ids, so
+    that their existence is not disclosed; contributors attempting a write get a 403.
     """
+    def has_permission(self, request, view):
+        project_id = view.kwargs.get("pk")
+        if project_id is None:
+            return True
+        access = _get_project_access(request, project_id)
+        # Unknown projects are left to the view, which answers with a 404.
+        return access is None or self._is_allowed(request, access)
+
     def has_object_permission(self, request, view, obj):
-        # Only users who are contributors to the project can access it.
-        return request.user in [contributor.user for contributor in obj.contributors.all()]
+        access = _get_project_access(request, obj.pk)
+        return access is not None and self._is_allowed(request, access)
+
+    @staticmethod
+    def _is_allowed(request, access):
+        if access["author_id"] == request.user.id:
+            return True
+        if not access["is_contributor"]:
+            raise NotFound()
+        # Only users who are contributors to the project can access it, read-only.
+        return request.method in _SAFE_METHODS
 
 
 class IsProjectAuthor(BasePermission):
     def has_permission(self, request, view):
         project_id = view.kwargs.get("project_pk")
-        project = Project.objects.filter(id=project_id).first()
-        return project and project.author == request.user
+        if not project_id:
+            return False
+        author_id = get_project_author_id(request, project_id)
+        return author_id is not None and author_id == request.user.id
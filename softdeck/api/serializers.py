@@ -1,12 +1,37 @@
+import copy
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 from .models import CustomUser, Project, Contributor, Issue, Comment
 from datetime import date
 
+# Shared by every user primary key field: validating a pk only needs the id column.
+_USERS_BY_PK = CustomUser.objects.only('id')
+
+
+class CachedFieldsMixin:
+    """
+    Builds the fields of a serializer class once and hands out copies of them afterwards.
+
+    DRF deep-copies every declared field and re-introspects the model each time a
+    serializer is instantiated. The unbound fields are identical for every instance of a
+    given class, so they are cached per class and shallow-copied before DRF binds them.
+    Nested serializers keep their own bound fields and are still deep-copied.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        fields = self._fields_cache.get(type(self))
+        if fields is None:
+            fields = self._fields_cache[type(self)] = super().get_fields()
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in fields.items()
+        }
+
 
 # ---------------------- USER SERIALIZERS ----------------------- #
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Represents a serializer for the User model to handle the conversion between
     complex data types such as instances or querysets and native Python data
@@ -63,7 +88,8 @@ class UserSerializer(serializers.ModelSerializer):
         update the following fields if they are present in validated_data: 'username', 'email',
         'birth_date', 'can_be_contacted', 'can_data_be_shared', and 'password'. If 'password' is
         present in the validated_data, the password will be properly hashed before saving. After
-        updating the instance with the provided data, it is saved back to the database.
+        updating the instance with the provided data, only the modified columns are saved back
+        to the database.
 
         :param instance:
             Instance of the user model to be updated.
@@ -74,20 +100,21 @@ class UserSerializer(serializers.ModelSerializer):
         :return:
             The updated instance of the user model.
         """
-        instance.username = validated_data.get("username", instance.username)
-        instance.email = validated_data.get("email", instance.email)
-        instance.birth_date = validated_data.get("birth_date", instance.birth_date)
-        instance.can_be_contacted = validated_data.get("can_be_contacted", instance.can_be_contacted)
-        instance.can_data_be_shared = validated_data.get("can_data_be_shared", instance.can_data_be_shared)
+        update_fields = []
+        for field in ("username", "email", "birth_date", "can_be_contacted", "can_data_be_shared"):
+            if field in validated_data:
+                setattr(instance, field, validated_data[field])
+                update_fields.append(field)
 
         if "password" in validated_data:
             instance.set_password(validated_data["password"])
+            update_fields.append("password")
 
-        instance.save()
+        instance.save(update_fields=update_fields or None)
         return instance
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer class for serializing a list of CustomUser objects.
 
@@ -110,22 +137,25 @@ class UserListSerializer(serializers.ModelSerializer):
 
 # ---------------------- PROJECT SERIALIZERS ----------------------- #
 
-class ProjectListSerializer(serializers.ModelSerializer):
-    author = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all())
+class ProjectListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    author = serializers.IntegerField(source='author_id', read_only=True)
 
     class Meta:
         model = Project
         fields = ('id', 'title', 'author')
 
-    def validate_project_title(self, value):
+    def validate_title(self, value):
         """ Checks if the project title is unique """
-        if Project.objects.filter(title=value).exists():
+        projects = Project.objects.filter(title=value)
+        if self.instance is not None:
+            projects = projects.exclude(pk=self.instance.pk)
+        if projects.exists():
             raise serializers.ValidationError("Un projet portant ce nom existe déja.")
         return value
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
-    author = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all())
+class ProjectDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    author = serializers.PrimaryKeyRelatedField(queryset=_USERS_BY_PK)
 
     class Meta:
         model = Project
@@ -134,8 +164,8 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
 
 # -------------------- CONTRIBUTOR SERIALIZER ---------------------- #
 
-class ContributorSerializer(serializers.ModelSerializer):
-    user = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all())
+class ContributorSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    user = serializers.PrimaryKeyRelatedField(queryset=_USERS_BY_PK)
 
     class Meta:
         model = Contributor
@@ -145,9 +175,9 @@ class ContributorSerializer(serializers.ModelSerializer):
 # ------------------------ ISSUE SERIALIZER ------------------------- #
 
 
-class IssueDetailSerializer(serializers.ModelSerializer):
+class IssueDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     author = serializers.PrimaryKeyRelatedField(read_only=True)
-    assigned_to = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all())
+    assigned_to = serializers.PrimaryKeyRelatedField(queryset=_USERS_BY_PK)
 
     class Meta:
         model = Issue
@@ -162,9 +192,9 @@ class IssueDetailSerializer(serializers.ModelSerializer):
         return value
 
 
-class IssueListSerializer(serializers.ModelSerializer):
-    author = serializers.PrimaryKeyRelatedField(read_only=True)
-    assigned_to = serializers.PrimaryKeyRelatedField(queryset=CustomUser.objects.all())
+class IssueListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    author = serializers.IntegerField(source='author_id', read_only=True)
+    assigned_to = serializers.PrimaryKeyRelatedField(queryset=_USERS_BY_PK)
 
     class Meta:
         model = Issue
@@ -173,9 +203,9 @@ class IssueListSerializer(serializers.ModelSerializer):
 # ------------------------ COMMENT SERIALIZER ------------------------- #
 
 
-class CommentDetailSerializer(serializers.ModelSerializer):
+class CommentDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     author = serializers.PrimaryKeyRelatedField(read_only=True)
-    issue = serializers.PrimaryKeyRelatedField(queryset=Issue.objects.all())
+    issue = serializers.PrimaryKeyRelatedField(queryset=Issue.objects.only('id'))
 
     class Meta:
         model = Comment
@@ -183,8 +213,8 @@ class CommentDetailSerializer(serializers.ModelSerializer):
         extra_kwargs = {'id': {'read_only': True}}
 
 
-class CommentListSerializer(serializers.ModelSerializer):
-    author = serializers.PrimaryKeyRelatedField(read_only=True, source='author.id')
+class CommentListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    author = serializers.IntegerField(source='author_id', read_only=True)
 
     class Meta:
         model = Comment
@@ -0,0 +1,12 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Project
+from .permissions import project_author_cache_key
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_author_cache(sender, instance, **kwargs):
+    """ Drops the cached author id of a project when it is saved or deleted. """
+    cache.delete(project_author_cache_key(instance.pk))
@@ -1,14 +1,12 @@
 from django.urls import path, include
 from .views import CustomTokenObtainPairView, RegisterUserView, UserDetailView, UserListView, ProjectViewSet, \
     ContributorViewSet, IssueViewSet, CommentViewSet
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 
-router = DefaultRouter()
+# Contributors, issues and comments are nested under a project and are routed explicitly below.
+router = SimpleRouter(trailing_slash=True)
 router.register('projects', ProjectViewSet, basename='projects')
-router.register('contributors', ContributorViewSet, basename='contributors')
-router.register('issues', IssueViewSet, basename='issues')
-router.register('comments', CommentViewSet, basename='comments')
 
 
 urlpatterns = [
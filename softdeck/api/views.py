@@ -1,13 +1,14 @@
-from django.core.exceptions import ValidationError
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Q
 from rest_framework import generics, viewsets, serializers, status
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
+from .mixins import ActionSerializerMixin, AutoPrefetchMixin, ListOnlyFieldsMixin, ListValuesMixin
+from .pagination import CreatedTimeCursorPagination
 from .models import CustomUser, Project, Contributor, Issue, Comment
-from .permissions import IsAuthorOrReadOnly, IsContributor, IsProjectAuthor
+from .permissions import IsAuthorOrReadOnly, IsProjectContributor, IsProjectAuthor, get_project_author_id
 from .serializers import UserSerializer, UserListSerializer, ProjectDetailSerializer, ProjectListSerializer, \
     ContributorSerializer, IssueDetailSerializer, IssueListSerializer, CommentListSerializer, CommentDetailSerializer
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
@@ -25,7 +26,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
     @classmethod
     def get_token(cls, user):
-        token = super().get_token(user)
+        # Same as the parent implementation, without going through super() on every login
+        token = cls.token_class.for_user(user)
         token['username'] = user.username
         return token
 
@@ -59,7 +61,7 @@ class RegisterUserView(generics.CreateAPIView):
 
     :ivar permission_classes: Specifies the permission classes applied to the
         view. In this case, the view allows unrestricted access to all users.
-    :type permission_classes: list[rest_framework.permissions.AllowAny]
+    :type permission_classes: tuple[rest_framework.permissions.AllowAny]
 
     :ivar queryset: Represents the set of objects available to this view.
         It uses all instances from the CustomUser model.
@@ -69,12 +71,12 @@ class RegisterUserView(generics.CreateAPIView):
         saving user data during registration.
     :type serializer_class: type[UserSerializer]
     """
-    permission_classes = [AllowAny]
+    permission_classes = (AllowAny,)
     queryset = CustomUser.objects.all()
     serializer_class = UserSerializer
 
 
-class UserListView(generics.ListAPIView):
+class UserListView(ListValuesMixin, AutoPrefetchMixin, generics.ListAPIView):
     """
     Represents a view for listing all users.
 
@@ -84,15 +86,18 @@ class UserListView(generics.ListAPIView):
     The view works with a specified query set and serializer to format the data.
 
     :ivar permission_classes: Permissions to access the view.
-    :type permission_classes: list
+    :type permission_classes: tuple
     :ivar queryset: Queryset defining the set of users to be listed.
     :type queryset: QuerySet
+    :ivar list_values_fields: Columns read by `UserListSerializer`, fetched as plain rows.
+    :type list_values_fields: tuple
     :ivar serializer_class: Serializer used to format the user data.
     :type serializer_class: serializers.Serializer
     """
-    permission_classes = [IsAuthenticated]
+    permission_classes = (IsAuthenticated,)
     queryset = CustomUser.objects.all()
     serializer_class = UserListSerializer
+    list_values_fields = ('id', 'username', 'email')
 
 
 class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -102,57 +107,64 @@ class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
     This class-based view allows interactions with the `CustomUser` model objects. It extends
     `RetrieveUpdateDestroyAPIView` to provide operations for retrieving details, updating data,
     or deleting a specific user instance. Permissions are configured to allow access to any user,
-    and the view utilizes a specific serializer for representation. Query filtering in this view
-    is implemented to retrieve a specific user by their primary key.
+    and the view utilizes a specific serializer for representation. The user is looked up by
+    primary key through the generic view's default `lookup_field`.
 
     :ivar permission_classes: List of permissions required to interact with the view.
-    :type permission_classes: list
-    :ivar queryset: Base queryset representing all ``CustomUser`` model instances.
+    :type permission_classes: tuple
+    :ivar queryset: Base queryset representing all ``CustomUser`` model instances, limited to
+        the columns exposed by ``UserSerializer``.
     :type queryset: QuerySet
     :ivar serializer_class: Serializer class used to serialize/deserialize ``CustomUser`` objects.
     :type serializer_class: type
     """
-    permission_classes = [IsAuthenticated]
-    queryset = CustomUser.objects.all()
+    permission_classes = (IsAuthenticated,)
+    queryset = CustomUser.objects.only(
+        'id', 'username', 'email', 'birth_date', 'can_be_contacted', 'can_data_be_shared'
+    )
     serializer_class = UserSerializer
 
-    def get_queryset(self):
-        return CustomUser.objects.filter(id=self.kwargs['pk'])
-
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(ActionSerializerMixin, ListValuesMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     Represents a viewset for managing projects within the system.
 
     Provides functionality for retrieving, creating, updating, and deleting
     projects. Integrates with different serializers based on the action being
-    performed. The queryset is filtered to display projects associated only
-    with the currently authenticated user through their contributor role.
+    performed. The list is filtered to display projects associated only
+    with the currently authenticated user through their authorship or contributor
+    role; access to a single project is enforced by `IsProjectContributor`.
 
     :ivar permission_classes: The default permission classes used within
         the viewset. Defines access permissions for requests.
-    :type permission_classes: list
+    :type permission_classes: tuple
+    :ivar serializer_classes: Serializer class per action, `'default'` for the others.
+    :type serializer_classes: dict
+    :ivar list_values_fields: Columns read by `ProjectListSerializer`, fetched as plain rows.
+    :type list_values_fields: tuple
     """
-    permission_classes = [IsAuthenticated, IsAuthorOrReadOnly, IsContributor]
+    permission_classes = (IsAuthenticated, IsProjectContributor)
+    lookup_value_regex = r'\d+'
+    serializer_classes = {'retrieve': ProjectDetailSerializer, 'default': ProjectListSerializer}
+    list_values_fields = ('id', 'title', 'author_id')
 
     def get_queryset(self):
-        return Project.objects.filter(
-            Q(contributors__user=self.request.user) | Q(author=self.request.user)
-        ).distinct()
-
-    def get_serializer_class(self):
-        if self.action == 'retrieve':
-            return ProjectDetailSerializer
-        else:
-            return ProjectListSerializer
+        if self.action != 'list':
+            # Access to a single project is checked by IsProjectContributor, the lookup is a pk seek
+            return Project.objects.all()
+        user = self.request.user
+        is_contributor = Exists(Contributor.objects.filter(project=OuterRef('pk'), user=user))
+        return Project.objects.filter(Q(author=user) | is_contributor)
 
     def perform_create(self, serializer):
-        project = serializer.save(author=self.request.user)
-        # Adds author as contributor
-        Contributor.objects.create(user=self.request.user, project=project)
+        user = self.request.user
+        with transaction.atomic():
+            project = serializer.save(author=user)
+            # Adds author as contributor
+            Contributor.objects.bulk_create([Contributor(user=user, project=project)])
 
 
-class ContributorViewSet(viewsets.ModelViewSet):
+class ContributorViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     Provides a viewset to manage project contributors, allowing operations such as listing,
     creating, and deleting contributor objects associated with specific projects. This
@@ -164,12 +176,12 @@ class ContributorViewSet(viewsets.ModelViewSet):
 
     :ivar permission_classes: Defines the permission class for the viewset to allow unrestricted
         access to its endpoints.
-    :type permission_classes: list
+    :type permission_classes: tuple
     :ivar serializer_class: Specifies the serializer class used to validate and serialize contributor
         data.
     :type serializer_class: ContributorSerializer
     """
-    permission_classes = [IsProjectAuthor]
+    permission_classes = (IsProjectAuthor,)
     serializer_class = ContributorSerializer
 
     def get_queryset(self):
@@ -188,29 +200,44 @@ class ContributorViewSet(viewsets.ModelViewSet):
         """
         This method handles the creation of an object using the provided serializer. It ensures
         that the user creating the object is authorized to do so based on the associated project's
-        author. If the requesting user is not the author of the project, a ValidationError is raised.
+        author. If the requesting user is not the author of the project, a PermissionDenied is raised.
         Once the validation process is completed successfully, the object is saved.
 
+        The project's author id is read from the request-scoped cache already filled by
+        `IsProjectAuthor`, so no additional query is issued.
+
         :param serializer: The serializer that contains the validated data for the object
             to be created.
         :return: None
-        :raises serializers.ValidationError: If the requesting user is not the author of
-            the project.
+        :raises NotFound: If the project does not exist.
+        :raises PermissionDenied: If the requesting user is not the author of the project.
+        :raises serializers.ValidationError: If the user is already a contributor of the project.
         """
+        request = self.request
         project_id = self.kwargs.get("project_pk")
-        project = get_object_or_404(Project, id=project_id)
+        author_id = get_project_author_id(request, project_id)
+        if author_id is None:
+            raise NotFound({"error": "Ce projet n'existe pas."})
 
         # Check that only the author can add a contributor
-        if project.author != self.request.user:
-            return Response({"error": "Seul l'auteur du projet peut ajouter des contributeurs."},
-                            status=status.HTTP_403_FORBIDDEN)
+        if author_id != request.user.id:
+            raise PermissionDenied("Seul l'auteur du projet peut ajouter des contributeurs.")
 
-        # Checks if the user is already a contributor
         user = serializer.validated_data["user"]
-        if Contributor.objects.filter(user=user, project=project).exists():
-            raise ValidationError("Cet utilisateur est déjà contributeur du projet.")
-
-        serializer.save(project=project)
+        if Contributor.objects.filter(project_id=project_id, user_id=user.pk).exists():
+            raise serializers.ValidationError("Cet utilisateur est déjà contributeur du projet.")
+
+        # The unique constraint catches concurrent requests adding the same contributor.
+        try:
+            with transaction.atomic():
+                serializer.save(project_id=project_id)
+        except IntegrityError as exc:
+            if Contributor.objects.filter(project_id=project_id, user_id=user.pk).exists():
+                raise serializers.ValidationError("Cet utilisateur est déjà contributeur du projet.") from exc
+            # The project may have been deleted since its author id was cached.
+            if not Project.objects.filter(pk=project_id).exists():
+                raise NotFound({"error": "Ce projet n'existe pas."}) from exc
+            raise
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -231,25 +258,25 @@ class ContributorViewSet(viewsets.ModelViewSet):
         project_id = self.kwargs.get("project_pk")  # ID du projet
         contributor_id = self.kwargs.get("contributor_pk")  # ID du contributeur
 
-        # Vérifier que le projet existe
-        project = get_object_or_404(Project, id=project_id)
+        # Vérifier que le projet existe (auteur déjà chargé par IsProjectAuthor)
+        author_id = get_project_author_id(request, project_id)
+        if author_id is None:
+            raise NotFound({"error": "Ce projet n'existe pas."})
 
         # Vérifier que seul l'auteur du projet peut supprimer un contributeur
-        if project.author != request.user:
+        if author_id != request.user.id:
             return Response({"error": "Seul l'auteur du projet peut supprimer un contributeur."},
                             status=status.HTTP_403_FORBIDDEN)
 
-        # Vérifier que le contributeur existe pour ce projet
-        contributor = Contributor.objects.filter(id=contributor_id, project_id=project_id).first()
-        if not contributor:
+        # Suppression du contributeur, s'il existe pour ce projet
+        deleted, _ = Contributor.objects.filter(id=contributor_id, project_id=project_id).delete()
+        if not deleted:
             raise NotFound({"error": "Ce contributeur n'existe pas pour ce projet."})
 
-        # Suppression du contributeur
-        contributor.delete()
         return Response({"message": "Contributeur supprimé avec succès."}, status=status.HTTP_204_NO_CONTENT)
 
 
-class IssueViewSet(viewsets.ModelViewSet):
+class IssueViewSet(ActionSerializerMixin, ListOnlyFieldsMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     This class represents a view set for managing issue instances in a project-based system.
 
@@ -258,9 +285,15 @@ class IssueViewSet(viewsets.ModelViewSet):
     through validation during operations.
 
     :ivar permission_classes: List of permission classes applied to the view set.
-    :type permission_classes: list
+    :type permission_classes: tuple
+    :ivar serializer_classes: Serializer class per action, `'default'` for the others.
+    :type serializer_classes: dict
+    :ivar only_fields: Columns selected by the list action for `IssueListSerializer`.
+    :type only_fields: tuple
     """
-    permission_classes = [IsAuthorOrReadOnly]
+    permission_classes = (IsAuthorOrReadOnly,)
+    serializer_classes = {'retrieve': IssueDetailSerializer, 'default': IssueListSerializer}
+    only_fields = ('id', 'title', 'priority', 'author', 'tag', 'status', 'assigned_to')
 
     def get_queryset(self):
         project_id = self.kwargs.get('project_pk')
@@ -270,23 +303,22 @@ class IssueViewSet(viewsets.ModelViewSet):
             return Issue.objects.filter(project_id=project_id, id=issue_id)
         return Issue.objects.filter(project_id=project_id)
 
-    def get_serializer_class(self):
-        if self.action == 'retrieve':
-            return IssueDetailSerializer
-        return IssueListSerializer
-
     def perform_create(self, serializer):
         project_id = self.kwargs.get("project_pk")
-        project = get_object_or_404(Project, id=project_id)
-
         assigned_to = serializer.validated_data.get("assigned_to")
-        if assigned_to and not Contributor.objects.filter(user=assigned_to, project=project).exists():
-            raise serializers.ValidationError("L'utilisateur assigné doit être un contributeur du projet.")
 
-        serializer.save(author=self.request.user, project=project)
+        # A contributor row can only exist for an existing project, so a successful membership
+        # check also proves the project exists: the project is only looked up on failure.
+        if not (assigned_to and Contributor.objects.filter(user=assigned_to, project_id=project_id).exists()):
+            if get_project_author_id(self.request, project_id) is None:
+                raise NotFound({"error": "Ce projet n'existe pas."})
+            if assigned_to:
+                raise serializers.ValidationError("L'utilisateur assigné doit être un contributeur du projet.")
 
+        serializer.save(author=self.request.user, project_id=project_id)
 
-class CommentViewSet(viewsets.ModelViewSet):
+
+class CommentViewSet(ActionSerializerMixin, ListValuesMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     Handles operations related to comments using a ModelViewSet.
 
@@ -298,21 +330,32 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     :ivar permission_classes: Permission classes that control access to the
         viewset. Defaults to AllowAny, allowing unrestricted access.
-    :type permission_classes: list
+    :type permission_classes: tuple
+    :ivar serializer_classes: Serializer class per action, `'default'` for the others.
+    :type serializer_classes: dict
+    :ivar list_values_fields: Columns read by `CommentListSerializer`, fetched as plain rows,
+        along with `created_time` which positions the pagination cursor.
+    :type list_values_fields: tuple
+    :ivar pagination_class: Cursor ordered by creation date, comment ids are not ordered in time.
+    :type pagination_class: type
     """
-    permission_classes = [IsAuthorOrReadOnly]
+    permission_classes = (IsAuthorOrReadOnly,)
+    pagination_class = CreatedTimeCursorPagination
+    serializer_classes = {
+        'retrieve': CommentDetailSerializer,
+        'update': CommentDetailSerializer,
+        'partial_update': CommentDetailSerializer,
+        'default': CommentListSerializer,
+    }
+    list_values_fields = ('id', 'description', 'author_id', 'created_time')
 
     def get_queryset(self):
         issue_id = self.kwargs.get('issue_pk')
         return Comment.objects.filter(issue_id=issue_id)
 
-    def get_serializer_class(self):
-        if self.action in ['retrieve', 'update', 'partial_update']:
-            return CommentDetailSerializer
-        return CommentListSerializer
-
     def perform_create(self, serializer):
         issue_id = self.kwargs.get("issue_pk")
-        issue = get_object_or_404(Issue, id=issue_id)
+        if not Issue.objects.filter(id=issue_id).exists():
+            raise NotFound({"error": "Cette issue n'existe pas."})
 
-        serializer.save(author=self.request.user, issue=issue)
+        serializer.save(author=self.request.user, issue_id=issue_id)
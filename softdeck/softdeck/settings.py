@@ -131,8 +131,9 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PERMISSION_CLASSES': ('rest_framework.permissions.IsAuthenticated',
     ),
-    'DEFAULT_PAGINATION_CLASS' : 'rest_framework.pagination.LimitOffsetPagination',
-    'PAGE_SIZE': 5
+    # Keyset pagination on the primary key: every page is an index range scan, whatever its position.
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.IdCursorPagination',
+    'PAGE_SIZE': 50
 }
 
 AUTH_USER_MODEL = 'api.CustomUser'
@@ -140,4 +141,8 @@ AUTH_USER_MODEL = 'api.CustomUser'
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+    # HMAC-SHA256 signing is much cheaper than RSA (RS256) on every login and token check.
+    # Trade-off: the same SIGNING_KEY signs and verifies, so tokens can only be verified
+    # by services that are trusted with that secret.
+    'ALGORITHM': 'HS256',
 }
\ No newline at end of file